@@ -4,13 +4,32 @@ from tqdm import tqdm
 from typing import List, Dict, Any
 import sys
 
+# Map CLI-friendly dtype names to torch dtype attribute names
+_TORCH_DTYPES = {'fp16': 'float16', 'bf16': 'bfloat16'}
+
 class ESCOEmbedding:
-    def __init__(self, model_name='all-MiniLM-L6-v2'):
-        """Initialize with a sentence transformer model"""
-        self.model = SentenceTransformer(model_name)
+    def __init__(self, model_name='all-MiniLM-L6-v2', backend='torch', dtype=None):
+        """Initialize with a sentence transformer model
+
+        Args:
+            model_name (str): Sentence transformer model to load
+            backend (str): Inference backend ('torch' or 'onnx'); 'onnx'
+                requires sentence-transformers with the onnx extra and can
+                be 1.5-3x faster for CPU inference
+            dtype (str): Numeric precision for torch inference ('fp32',
+                'fp16' or 'bf16'); half precision roughly halves memory and
+                speeds up GPU inference
+        """
+        model_kwargs = {}
+        if dtype in _TORCH_DTYPES:
+            import torch
+            model_kwargs['model_kwargs'] = {'torch_dtype': getattr(torch, _TORCH_DTYPES[dtype])}
+        if backend and backend != 'torch':
+            model_kwargs['backend'] = backend
+        self.model = SentenceTransformer(model_name, **model_kwargs)
         self.vector_dim = self.model.get_sentence_embedding_dimension()
         self.logger = logging.getLogger(__name__)
-        self.logger.info(f"Initialized embedding model: {model_name} (dim: {self.vector_dim})")
+        self.logger.info(f"Initialized embedding model: {model_name} (dim: {self.vector_dim}, backend: {backend}, dtype: {dtype or 'fp32'})")
         
     def generate_text_embedding(self, text):
         """Generate embedding for a single text"""
@@ -1,18 +1,19 @@
 #!/usr/bin/env python3
 import argparse
-import logging
+import atexit
+import copy
+import functools
 import os
+import sys
 import yaml
 import json
-from datetime import datetime
-from neo4j import GraphDatabase
-from semantic_search import ESCOSemanticSearch
-from embedding_utils import ESCOEmbedding
-from esco_ingest import ESCOIngest
-from esco_translate import ESCOTranslator
-from download_model import download_model
 from logging_config import setup_logging
 
+# Heavy dependencies (neo4j driver, torch/transformers via the search,
+# ingest and translate modules) are imported lazily inside the command
+# branches that need them, so `--help` and `download-model` don't pay
+# their import cost.
+
 # Setup logging
 logger = setup_logging()
 
@@ -27,11 +28,18 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
-def colorize(text, color):
-    """Add color to text if terminal supports it"""
-    if os.getenv('NO_COLOR') or not os.isatty(1):
+# Decide once at import time whether the terminal supports color; checking
+# NO_COLOR and isatty on every colorize() call costs two syscalls per field.
+_USE_COLOR = not os.getenv('NO_COLOR') and sys.stdout.isatty()
+
+if _USE_COLOR:
+    def colorize(text, color):
+        """Add color to text if terminal supports it"""
+        return f"{color}{text}{Colors.ENDC}"
+else:
+    def colorize(text, color):
+        """Add color to text if terminal supports it"""
         return text
-    return f"{color}{text}{Colors.ENDC}"
 
 def print_header(text):
     """Print a section header"""
@@ -45,56 +53,135 @@ def print_section(text):
     print(colorize(f" {text} ".center(80, "-"), Colors.BLUE))
     print("-" * 80 + "\n")
 
-def print_result(result, index=None):
-    """Print a single search result"""
+def format_result(result, index=None):
+    """Format a single search result as a string"""
     if index is not None:
         prefix = f"{index}. "
     else:
         prefix = "• "
-    
-    # Print the main label with type
+
+    # Main label with type and score
     type_str = colorize(f"[{result['type']}]", Colors.YELLOW)
     score_str = colorize(f"(Score: {result['score']:.4f})", Colors.GREEN)
-    print(f"{prefix}{type_str} {result['label']} {score_str}")
-    
-    # Print description if available
+    lines = [f"{prefix}{type_str} {result['label']} {score_str}"]
+
+    # Description if available
     if result.get('description'):
         desc = result['description']
-        if len(desc) > 100:
-            desc = desc[:97] + "..."
-        print(f"   {colorize('Description:', Colors.BOLD)} {desc}")
+        desc = (desc[:97] + "…") if len(desc) > 100 else desc
+        lines.append(f"   {colorize('Description:', Colors.BOLD)} {desc}")
 
-def print_related_nodes(related_graph):
-    """Print related nodes in a structured format"""
+    return "\n".join(lines)
+
+@functools.lru_cache(maxsize=64)
+def _format_rel_type(rel_type):
+    """Format a relationship type name for display
+
+    Cached because the set of relationship names is small and bounded
+    (essential_occupations, broader_skills, ...) but reformatted for every
+    result that carries a related graph.
+    """
+    return rel_type.replace('_', ' ').title()
+
+def format_related_nodes(related_graph):
+    """Format related nodes as a structured string"""
     if not related_graph:
-        return
-    
+        return ""
+
     node = related_graph['node']
-    print_section(f"Related entities for '{node['label']}'")
-    
+    lines = [
+        "\n" + "-" * 80,
+        colorize(f" Related entities for '{node['label']}' ".center(80, "-"), Colors.BLUE),
+        "-" * 80,
+    ]
+
     for rel_type, rel_nodes in related_graph['related'].items():
         if not rel_nodes:
             continue
-            
+
         # Format the relationship type
-        rel_type_display = rel_type.replace('_', ' ').title()
+        rel_type_display = _format_rel_type(rel_type)
         count = len(rel_nodes)
-        print(f"\n{colorize(rel_type_display, Colors.BOLD)} ({count}):")
-        
-        # Print first 5 nodes
-        for node in rel_nodes[:5]:
-            print(f"  • {node['label']}")
-        
+        lines.append(f"\n{colorize(rel_type_display, Colors.BOLD)} ({count}):")
+
+        # Show first 5 nodes
+        lines.extend(f"  • {node['label']}" for node in rel_nodes[:5])
+
         # Indicate if there are more
         if count > 5:
-            print(f"  ... and {count - 5} more")
+            lines.append(f"  ... and {count - 5} more")
 
-def format_json_output(data):
-    """Format JSON output with consistent indentation"""
-    return json.dumps(data, indent=2, ensure_ascii=False)
+    return "\n".join(lines)
+
+def print_related_nodes(related_graph):
+    """Print related nodes in a single buffered write"""
+    formatted = format_related_nodes(related_graph)
+    if formatted:
+        sys.stdout.write(formatted + "\n")
+
+try:
+    import orjson
+
+    def format_json_output(data):
+        """Format JSON output with consistent indentation"""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+    def _json_dumps(data):
+        """Compact JSON encoding for streamed output"""
+        return orjson.dumps(data).decode()
+except ImportError:
+    def format_json_output(data):
+        """Format JSON output with consistent indentation"""
+        return json.dumps(data, indent=2, ensure_ascii=False)
+
+    def _json_dumps(data):
+        """Compact JSON encoding for streamed output"""
+        return json.dumps(data, ensure_ascii=False)
+
+def stream_json_results(query, results, related_graph_fn=None, parameters=None):
+    """Write a JSON payload to stdout one result at a time
+
+    Results may be any iterable; each item is serialized and written as it
+    is consumed, so when given a generator (e.g. search_iter) peak memory
+    stays constant regardless of result count. When related_graph_fn is
+    given it is called with the first result (or None if there were no
+    results) after the results array is written, and a "related_graph" key
+    is always emitted — matching the one-shot --json shape, where the key
+    is null unless --related found something.
+    """
+    sys.stdout.write('\n{"query": ' + _json_dumps(query))
+    if parameters is not None:
+        sys.stdout.write(', "parameters": ' + _json_dumps(parameters))
+    sys.stdout.write(', "results": [')
+    first = None
+    for i, result in enumerate(results):
+        if i:
+            sys.stdout.write(",")
+        else:
+            first = result
+        sys.stdout.write(_json_dumps(result))
+    sys.stdout.write("]")
+    if related_graph_fn is not None:
+        sys.stdout.write(', "related_graph": ' + _json_dumps(related_graph_fn(first)))
+    sys.stdout.write("}\n")
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml(abspath, mtime):
+    """Parse a YAML file, memoized on (absolute path, mtime)
+
+    The mtime argument is only part of the cache key: it invalidates the
+    cached entry when the file changes on disk. The C loader (libyaml) is
+    used when available since it parses several times faster than the
+    pure-Python loader.
+    """
+    with open(abspath, 'r') as f:
+        return yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
 
 def load_config(config_path=None, profile='default'):
     """Load and validate configuration file"""
+    if config_path is None:
+        # ESCO_CONFIG avoids probing the default locations entirely
+        config_path = os.environ.get('ESCO_CONFIG')
     if config_path is None:
         # Try to find config in default locations
         default_paths = [
@@ -102,20 +189,22 @@ def load_config(config_path=None, profile='default'):
             '../config/neo4j_config.yaml',
             os.path.expanduser('~/.esco/neo4j_config.yaml')
         ]
-        for path in default_paths:
-            if os.path.exists(path):
-                config_path = path
-                break
-    
-    if not config_path or not os.path.exists(config_path):
+        config_path = next((path for path in default_paths if os.path.exists(path)), None)
+
+    # No second exists() check here: probed paths were just stat'ed, and an
+    # explicitly passed path that is missing fails at open() with a clear
+    # error anyway.
+    if not config_path:
         raise FileNotFoundError(
             "Configuration file not found. Please specify --config or ensure "
             "config/neo4j_config.yaml exists."
         )
-    
+
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        abspath = os.path.abspath(config_path)
+        # Deep-copy the cached parse so callers that mutate their config
+        # (e.g. injecting defaults) can't poison later loads
+        config = copy.deepcopy(_load_yaml(abspath, os.stat(abspath).st_mtime))
     except Exception as e:
         raise ValueError(f"Failed to load config file: {str(e)}")
     
@@ -132,53 +221,250 @@ def load_config(config_path=None, profile='default'):
     
     return config
 
+# Drivers are cached per (uri, user) so repeated main() invocations in the
+# same process reuse the bolt connection pool instead of paying the TLS and
+# handshake cost again. They are closed once, at interpreter exit.
+_DRIVERS = {}
+
+def _close_drivers():
+    for driver in _DRIVERS.values():
+        driver.close()
+    _DRIVERS.clear()
+
+atexit.register(_close_drivers)
+
 def setup_neo4j_connection(config, profile='default'):
-    """Setup Neo4j connection using config parameters"""
+    """Setup (or reuse) a Neo4j driver using config parameters"""
+    from neo4j import GraphDatabase
+
     neo4j_config = config[profile]
-    return GraphDatabase.driver(
-        neo4j_config['uri'],
-        auth=(neo4j_config['user'], neo4j_config['password']),
-        max_connection_lifetime=neo4j_config.get('max_connection_lifetime', 3600),
-        max_connection_pool_size=neo4j_config.get('max_connection_pool_size', 50),
-        connection_timeout=neo4j_config.get('connection_timeout', 30)
-    )
+    key = (neo4j_config['uri'], neo4j_config['user'])
+    if key not in _DRIVERS:
+        _DRIVERS[key] = GraphDatabase.driver(
+            neo4j_config['uri'],
+            auth=(neo4j_config['user'], neo4j_config['password']),
+            max_connection_lifetime=neo4j_config.get('max_connection_lifetime', 3600),
+            max_connection_pool_size=neo4j_config.get('max_connection_pool_size', 100),
+            connection_timeout=neo4j_config.get('connection_timeout', 30)
+        )
+    return _DRIVERS[key]
+
+def _cmd_download(args):
+    """Run the download-model command"""
+    from download_model import download_model
+
+    print_header("Downloading Translation Model")
+    download_model()
+    print(colorize("\n✓ Model downloaded successfully", Colors.GREEN))
+
+def _cmd_ingest(args):
+    """Run the ingest command"""
+    from esco_ingest import ESCOIngest
+
+    config = load_config(args.config, args.profile)
+    setup_neo4j_connection(config, args.profile)
+
+    print_header("ESCO Data Ingestion")
+    ingest = ESCOIngest(args.config, args.profile)
+    if args.delete_all:
+        print_section("Deleting Existing Data")
+        ingest.delete_all_data()
+        print(colorize("✓ All data deleted", Colors.GREEN))
+
+    print_section("Starting Ingestion")
+    if args.embeddings_only:
+        print("Generating embeddings only...")
+        ingest.run_embeddings_only()
+    else:
+        print("Running full ingestion...")
+        ingest.run_ingest()
+    ingest.close()
+    print(colorize("\n✓ Ingestion completed successfully", Colors.GREEN))
+
+def _cmd_search(args):
+    """Run the search command"""
+    from embedding_utils import ESCOEmbedding
+    from semantic_search import ESCOSemanticSearch
+
+    config = load_config(args.config, args.profile)
+    driver = setup_neo4j_connection(config, args.profile)
+
+    print_header("ESCO Semantic Search")
+    print(f"Query: {colorize(args.query, Colors.BOLD)}")
+    print(f"Type: {colorize(args.type, Colors.BOLD)}")
+    print(f"Threshold: {colorize(str(args.threshold), Colors.BOLD)}")
+
+    embedding_util = ESCOEmbedding(backend=args.embed_backend, dtype=args.embed_dtype)
+    search_service = ESCOSemanticSearch(driver, embedding_util)
+
+    # Encode the query once up front; both search paths (and a 'Both' type
+    # search) reuse the same vector instead of re-running the transformer
+    # per node type.
+    query_vec = embedding_util.generate_text_embedding(args.query)
+
+    print_section("Searching...")
+
+    if args.profile_search:
+        if args.type != "Occupation":
+            print(colorize("\nWarning: Profile search is only available for Occupation type. Switching to Occupation type.", Colors.YELLOW))
+            args.type = "Occupation"
+
+        results = search_service.semantic_search_with_profile(
+            args.query,
+            args.limit,
+            args.threshold,
+            query_vec=query_vec
+        )
 
-def setup_logging(level=logging.INFO):
-    """Setup logging configuration for all modules
-    
-    Args:
-        level (int): Logging level (default: logging.INFO)
-    """
-    # Create logs directory if it doesn't exist
-    os.makedirs('logs', exist_ok=True)
-    
-    # Configure logging format
-    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    
-    # Configure root logger
-    logging.basicConfig(
-        level=level,
-        format=log_format,
-        handlers=[
-            logging.StreamHandler(),  # Console handler
-            logging.FileHandler('logs/esco.log')  # File handler
-        ]
-    )
-    
-    # Set specific logger levels
-    logging.getLogger('neo4j').setLevel(logging.WARNING)  # Reduce Neo4j driver logging
-    logging.getLogger('urllib3').setLevel(logging.WARNING)  # Reduce urllib3 logging
-    logging.getLogger('tqdm').setLevel(logging.WARNING)  # Reduce tqdm logging
-    logging.getLogger('sentence_transformers').setLevel(logging.WARNING)  # Reduce sentence-transformers logging
-    logging.getLogger('transformers').setLevel(logging.WARNING)  # Reduce transformers logging
-    
-    # Disable tqdm progress bars for specific modules
-    import tqdm
-    tqdm.tqdm.monitor_interval = 0  # Disable tqdm monitoring
-    
-    return logging.getLogger(__name__)
+        if args.stream_json:
+            # Stream unconditionally (empty results included) and skip the
+            # human-readable listing, matching the plain-search path. The
+            # profile results are materialized either way, so streaming
+            # here only avoids the second pretty-printed copy.
+            stream_json_results(
+                args.query,
+                results,
+                parameters={
+                    "limit": args.limit,
+                    "similarity_threshold": args.threshold
+                }
+            )
+            return
+
+        if not results:
+            print(colorize("\nNo results found.", Colors.YELLOW))
+            return
+
+        print_section("Search Results with Profiles")
+        buf = []
+        for i, result in enumerate(results, 1):
+            buf.append(format_result(result['search_result'], i))
+            profile_str = format_related_nodes(result['profile'])
+            if profile_str:
+                buf.append(profile_str)
+        sys.stdout.write("\n".join(buf) + "\n")
+
+        if args.json:
+            print("\n" + format_json_output({
+                "query": args.query,
+                "parameters": {
+                    "limit": args.limit,
+                    "similarity_threshold": args.threshold
+                },
+                "results": results
+            }))
+    else:
+        # When results are only displayed, let Neo4j truncate descriptions
+        # server-side so full text never crosses bolt; 101 chars is enough
+        # for format_result to keep its ellipsis behavior. JSON output still
+        # gets the complete descriptions.
+        wants_json = args.json or args.stream_json
+        results_iter = search_service.search_iter(
+            args.query,
+            args.type,
+            args.limit,
+            args.search_only,
+            args.threshold,
+            query_vec=query_vec,
+            truncate_desc=None if wants_json else 101
+        )
+
+        if args.stream_json:
+            # Stream straight from the iterator — the human-readable block
+            # is suppressed so results are consumed exactly once and never
+            # held in memory. The related graph (null unless --related hits
+            # something) is fetched after the results array is written.
+            def _related_graph(top):
+                if args.related and top:
+                    return search_service.get_related_graph(top['uri'], top['type'])
+                return None
+
+            stream_json_results(args.query, results_iter, related_graph_fn=_related_graph)
+            return
+
+        if not (args.json or args.related):
+            # Pure display: print each result as it arrives from Neo4j
+            # instead of materializing the full list first.
+            print_section("Search Results")
+            count = 0
+            for count, result in enumerate(results_iter, 1):
+                sys.stdout.write(format_result(result, count) + "\n")
+            if count == 0:
+                print(colorize("\nNo results found.", Colors.YELLOW))
+            return
+
+        # JSON output and the related-graph lookup need the full result set
+        results = list(results_iter)
+
+        if not results:
+            print(colorize("\nNo results found.", Colors.YELLOW))
+            return
+
+        print_section("Search Results")
+        sys.stdout.write(
+            "\n".join(format_result(result, i) for i, result in enumerate(results, 1)) + "\n"
+        )
+
+        # Fetch the top result's related graph once; printing and JSON
+        # output share it instead of issuing the Neo4j query twice.
+        related_graph = None
+        if args.related and results:
+            related_graph = search_service.get_related_graph(results[0]['uri'], results[0]['type'])
+            print_related_nodes(related_graph)
+
+        if args.json:
+            print("\n" + format_json_output({
+                "query": args.query,
+                "results": results,
+                "related_graph": related_graph
+            }))
+
+def _cmd_translate(args):
+    """Run the translate command"""
+    from esco_translate import ESCOTranslator
+
+    config = load_config(args.config, args.profile)
+    setup_neo4j_connection(config, args.profile)
+
+    print_header("ESCO Translation")
+    print(f"Type: {colorize(args.type, Colors.BOLD)}")
+    print(f"Property: {colorize(args.property, Colors.BOLD)}")
+    print(f"Batch Size: {colorize(str(args.batch_size), Colors.BOLD)}")
+    if args.device:
+        print(f"Device: {colorize(args.device, Colors.BOLD)}")
+
+    print_section("Starting Translation")
+    translator = ESCOTranslator(args.config, args.profile, args.device)
+    translator.translate_nodes(args.type, args.property, args.batch_size)
+    translator.close()
+    print(colorize("\n✓ Translation completed successfully", Colors.GREEN))
+
+# Dispatch table mapping subcommand names to their handlers; each handler
+# does its own lazy imports and connection setup.
+COMMANDS = {
+    'download-model': _cmd_download,
+    'ingest': _cmd_ingest,
+    'search': _cmd_search,
+    'translate': _cmd_translate,
+}
+
+def _run(command, args):
+    """Dispatch a command with shared error reporting"""
+    try:
+        COMMANDS[command](args)
+    except Exception as e:
+        print(colorize(f"\nError: {str(e)}", Colors.RED))
+        raise
 
 def main():
+    # Fast path: a bare `download-model` takes no options, so skip building
+    # the argparse tree (subparsers, parents, dozens of Action objects)
+    # entirely for it. Anything with flags or --help falls through to the
+    # full parser below.
+    if len(sys.argv) == 2 and sys.argv[1] == 'download-model':
+        _run('download-model', None)
+        return
+
     parser = argparse.ArgumentParser(
         description='ESCO Data Management and Search CLI',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -198,6 +484,10 @@ Examples:
 
   # Get help for a specific command
   python esco_cli.py search --help
+
+Environment variables:
+  ESCO_CONFIG    Path to the YAML config file; used when --config is not
+                 given, skipping the default-location probe.
         """
     )
 
@@ -233,8 +523,15 @@ Examples:
     search_parser.add_argument('--threshold', type=float, default=0.5,
                             help='Minimum similarity score threshold (0.0 to 1.0)')
     search_parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    search_parser.add_argument('--stream-json', action='store_true',
+                            help='Stream JSON results incrementally instead of one pretty-printed document '
+                                 '(suppresses the human-readable result listing)')
     search_parser.add_argument('--profile-search', action='store_true',
                             help='Perform semantic search and retrieve complete occupation profiles')
+    search_parser.add_argument('--embed-backend', type=str, choices=['torch', 'onnx'], default='torch',
+                            help='Inference backend for the embedding model')
+    search_parser.add_argument('--embed-dtype', type=str, choices=['fp32', 'fp16', 'bf16'], default='fp32',
+                            help='Numeric precision for embedding inference')
 
     # Translate command
     translate_parser = subparsers.add_parser('translate', parents=[common_parser], help='Translate ESCO data')
@@ -255,130 +552,7 @@ Examples:
         parser.print_help()
         return
 
-    try:
-        if args.command == 'download-model':
-            print_header("Downloading Translation Model")
-            download_model()
-            print(colorize("\n✓ Model downloaded successfully", Colors.GREEN))
-            return
-
-        # For commands that need Neo4j connection
-        if args.command in ['ingest', 'search', 'translate']:
-            # Load config
-            config = load_config(args.config, args.profile)
-            
-            # Setup Neo4j connection
-            driver = setup_neo4j_connection(config, args.profile)
-
-            if args.command == 'ingest':
-                print_header("ESCO Data Ingestion")
-                ingest = ESCOIngest(args.config, args.profile)
-                if args.delete_all:
-                    print_section("Deleting Existing Data")
-                    ingest.delete_all_data()
-                    print(colorize("✓ All data deleted", Colors.GREEN))
-                
-                print_section("Starting Ingestion")
-                if args.embeddings_only:
-                    print("Generating embeddings only...")
-                    ingest.run_embeddings_only()
-                else:
-                    print("Running full ingestion...")
-                    ingest.run_ingest()
-                ingest.close()
-                print(colorize("\n✓ Ingestion completed successfully", Colors.GREEN))
-
-            elif args.command == 'search':
-                print_header("ESCO Semantic Search")
-                print(f"Query: {colorize(args.query, Colors.BOLD)}")
-                print(f"Type: {colorize(args.type, Colors.BOLD)}")
-                print(f"Threshold: {colorize(str(args.threshold), Colors.BOLD)}")
-                
-                embedding_util = ESCOEmbedding()
-                search_service = ESCOSemanticSearch(driver, embedding_util)
-                
-                print_section("Searching...")
-                
-                if args.profile_search:
-                    if args.type != "Occupation":
-                        print(colorize("\nWarning: Profile search is only available for Occupation type. Switching to Occupation type.", Colors.YELLOW))
-                        args.type = "Occupation"
-                    
-                    results = search_service.semantic_search_with_profile(
-                        args.query,
-                        args.limit,
-                        args.threshold
-                    )
-                    
-                    if not results:
-                        print(colorize("\nNo results found.", Colors.YELLOW))
-                        return
-                    
-                    print_section("Search Results with Profiles")
-                    for i, result in enumerate(results, 1):
-                        search_result = result['search_result']
-                        print_result(search_result, i)
-                        print_related_nodes(result['profile'])
-                    
-                    if args.json:
-                        print("\n" + format_json_output({
-                            "query": args.query,
-                            "parameters": {
-                                "limit": args.limit,
-                                "similarity_threshold": args.threshold
-                            },
-                            "results": results
-                        }))
-                else:
-                    results = search_service.search(
-                        args.query, 
-                        args.type, 
-                        args.limit, 
-                        args.search_only,
-                        args.threshold
-                    )
-
-                    if not results:
-                        print(colorize("\nNo results found.", Colors.YELLOW))
-                        return
-
-                    print_section("Search Results")
-                    for i, result in enumerate(results, 1):
-                        print_result(result, i)
-
-                    if args.related and results:
-                        print_related_nodes(search_service.get_related_graph(results[0]['uri'], results[0]['type']))
-
-                    if args.json:
-                        related_graph = None
-                        if args.related and results:
-                            related_graph = search_service.get_related_graph(results[0]['uri'], results[0]['type'])
-                        print("\n" + format_json_output({
-                            "query": args.query,
-                            "results": results,
-                            "related_graph": related_graph
-                        }))
-
-            elif args.command == 'translate':
-                print_header("ESCO Translation")
-                print(f"Type: {colorize(args.type, Colors.BOLD)}")
-                print(f"Property: {colorize(args.property, Colors.BOLD)}")
-                print(f"Batch Size: {colorize(str(args.batch_size), Colors.BOLD)}")
-                if args.device:
-                    print(f"Device: {colorize(args.device, Colors.BOLD)}")
-                
-                print_section("Starting Translation")
-                translator = ESCOTranslator(args.config, args.profile, args.device)
-                translator.translate_nodes(args.type, args.property, args.batch_size)
-                translator.close()
-                print(colorize("\n✓ Translation completed successfully", Colors.GREEN))
-
-    except Exception as e:
-        print(colorize(f"\nError: {str(e)}", Colors.RED))
-        raise
-    finally:
-        if 'driver' in locals():
-            driver.close()
+    _run(args.command, args)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
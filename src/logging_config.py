@@ -1,30 +1,47 @@
 import logging
+import logging.handlers
 import os
+import sys
 
 def setup_logging(level=logging.INFO):
     """Setup logging configuration for all modules
-    
+
     Args:
         level (int): Logging level (default: logging.INFO)
     """
     # Create logs directory if it doesn't exist
     os.makedirs('logs', exist_ok=True)
-    
+
     # Configure logging format
     log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    
-    # Configure root logger
+
+    # Configure root logger. The log file is opened lazily (delay=True) so
+    # invocations that never log to file skip the open() at startup, and
+    # rotation keeps disk use bounded.
     logging.basicConfig(
         level=level,
         format=log_format,
         handlers=[
             logging.StreamHandler(),  # Console handler
-            logging.FileHandler('logs/esco.log')  # File handler
+            logging.handlers.RotatingFileHandler(
+                'logs/esco.log',
+                maxBytes=10 * 1024 * 1024,
+                backupCount=3,
+                delay=True
+            )
         ]
     )
     
     # Set specific logger levels
     logging.getLogger('neo4j').setLevel(logging.WARNING)  # Reduce Neo4j driver logging
     logging.getLogger('urllib3').setLevel(logging.WARNING)  # Reduce urllib3 logging
-    
-    return logging.getLogger(__name__) 
\ No newline at end of file
+    logging.getLogger('tqdm').setLevel(logging.WARNING)  # Reduce tqdm logging
+    logging.getLogger('sentence_transformers').setLevel(logging.WARNING)  # Reduce sentence-transformers logging
+    logging.getLogger('transformers').setLevel(logging.WARNING)  # Reduce transformers logging
+
+    # Disable tqdm's monitor thread when tqdm is loaded; don't import it
+    # here just to configure it, since not every command uses it
+    if 'tqdm' in sys.modules:
+        sys.modules['tqdm'].tqdm.monitor_interval = 0
+
+    return logging.getLogger(__name__)
\ No newline at end of file
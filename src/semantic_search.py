@@ -1,4 +1,7 @@
+import heapq
+import itertools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from embedding_utils import ESCOEmbedding
 from logging_config import setup_logging
 
@@ -36,77 +39,94 @@ class ESCOSemanticSearch:
             count = result.single()["count"]
             return count > 0
         
-    def search(self, query_text, node_type="Skill", limit=10, search_only=False, similarity_threshold=0.5):
-        """Search for semantically similar nodes
-        
+    def search(self, query_text, node_type="Skill", limit=10, search_only=False, similarity_threshold=0.5, query_vec=None, truncate_desc=None):
+        """Search for semantically similar nodes, returning a list
+
+        See search_iter for the argument descriptions; this wrapper simply
+        materializes the streamed results for callers that need the full
+        result set in memory.
+        """
+        return list(self.search_iter(query_text, node_type, limit, search_only,
+                                     similarity_threshold, query_vec, truncate_desc))
+
+    def search_iter(self, query_text, node_type="Skill", limit=10, search_only=False, similarity_threshold=0.5, query_vec=None, truncate_desc=None):
+        """Search for semantically similar nodes, yielding results as they arrive
+
+        Results are yielded straight off the Neo4j result stream, so the
+        first record is available as soon as the server returns it and peak
+        memory stays constant regardless of limit.
+
         Args:
             query_text (str): The text to search for
             node_type (str): Type of nodes to search ("Skill", "Occupation", or "Both")
             limit (int): Maximum number of results to return
             search_only (bool): If True, only perform search without re-indexing
             similarity_threshold (float): Minimum similarity score (0.0 to 1.0)
+            query_vec (list): Precomputed query embedding; when provided the
+                query text is not re-encoded, saving a transformer forward pass
+            truncate_desc (int): When set, descriptions are truncated to this
+                many characters inside Neo4j so full descriptions are never
+                moved over bolt just to be cut client-side
         """
         # Check if data is indexed if in search-only mode
         if search_only and not self.is_data_indexed(node_type):
             raise ValueError("Data is not indexed. Please run the full pipeline first or disable search-only mode.")
-        
-        # Generate query embedding
-        query_embedding = self.embedding_util.generate_text_embedding(query_text)
+
+        # Generate query embedding unless the caller already has one
+        query_embedding = query_vec if query_vec is not None else self.embedding_util.generate_text_embedding(query_text)
         if not query_embedding:
             logging.error("Failed to generate embedding for query text")
-            return []
+            return
         
+        if node_type == "Both":
+            # Fire the Skill and Occupation queries concurrently; bolt I/O
+            # releases the GIL, so wall time is roughly the slower of the
+            # two instead of their sum. Each sub-query is already ordered
+            # by score, so a heap-merge yields the combined top results.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                skills = executor.submit(
+                    list, self._search_label("Skill", query_embedding, limit, similarity_threshold, truncate_desc))
+                occupations = executor.submit(
+                    list, self._search_label("Occupation", query_embedding, limit, similarity_threshold, truncate_desc))
+                merged = heapq.merge(skills.result(), occupations.result(), key=lambda r: -r["score"])
+            yield from itertools.islice(merged, limit)
+        else:
+            yield from self._search_label(node_type, query_embedding, limit, similarity_threshold, truncate_desc)
+
+    def _search_label(self, label, query_embedding, limit, similarity_threshold, truncate_desc=None):
+        """Run the vector search for a single node label, yielding results
+
+        Each call opens its own session, so concurrent calls from different
+        threads are safe (sessions are not thread-safe, the driver is).
+        """
+        # The label is interpolated into the query text (labels cannot be
+        # parameterized in Cypher), so reject anything outside the known set
+        if label not in ("Skill", "Occupation"):
+            raise ValueError(f"Unsupported node type: {label!r} (expected 'Skill', 'Occupation' or 'Both')")
+
         with self.driver.session() as session:
-            # Perform vector search in Neo4j
-            if node_type == "Skill":
-                result = session.run("""
-                    MATCH (s:Skill)
-                    WHERE s.embedding IS NOT NULL
-                    WITH s, vector.similarity.cosine(s.embedding, $query_embedding) AS score
-                    WHERE score > $threshold
-                    RETURN s.conceptUri AS uri, s.preferredLabel AS label, 
-                           s.description AS description, score
-                    ORDER BY score DESC
-                    LIMIT $limit
-                """, query_embedding=query_embedding, limit=limit, threshold=similarity_threshold)
-            elif node_type == "Occupation":
-                result = session.run("""
-                    MATCH (o:Occupation)
-                    WHERE o.embedding IS NOT NULL
-                    WITH o, vector.similarity.cosine(o.embedding, $query_embedding) AS score
-                    WHERE score > $threshold
-                    RETURN o.conceptUri AS uri, o.preferredLabel AS label, 
-                           o.description AS description, score
-                    ORDER BY score DESC
-                    LIMIT $limit
-                """, query_embedding=query_embedding, limit=limit, threshold=similarity_threshold)
-            else:
-                # Search both skills and occupations
-                result = session.run("""
-                    MATCH (n)
-                    WHERE (n:Skill OR n:Occupation) AND n.embedding IS NOT NULL
-                    WITH n, 
-                         labels(n)[0] AS type,
-                         vector.similarity.cosine(n.embedding, $query_embedding) AS score
-                    WHERE score > $threshold
-                    RETURN n.conceptUri AS uri, n.preferredLabel AS label, 
-                           n.description AS description, type, score
-                    ORDER BY score DESC
-                    LIMIT $limit
-                """, query_embedding=query_embedding, limit=limit, threshold=similarity_threshold)
-            
-            # Process results
-            search_results = []
+            result = session.run(f"""
+                MATCH (n:{label})
+                WHERE n.embedding IS NOT NULL
+                WITH n, vector.similarity.cosine(n.embedding, $query_embedding) AS score
+                WHERE score > $threshold
+                RETURN n.conceptUri AS uri, n.preferredLabel AS label,
+                       CASE WHEN $desc_len IS NULL THEN n.description
+                            ELSE left(n.description, $desc_len) END AS description, score
+                ORDER BY score DESC
+                LIMIT $limit
+            """, query_embedding=query_embedding, limit=limit, threshold=similarity_threshold,
+                 desc_len=truncate_desc)
+
+            # Yield results as the driver consumes the bolt stream
             for record in result:
-                search_results.append({
+                yield {
                     "uri": record["uri"],
                     "label": record["label"],
                     "description": record.get("description", ""),
-                    "type": record.get("type", node_type),
+                    "type": label,
                     "score": record["score"]
-                })
-            
-            return search_results
+                }
     
     def get_related_graph(self, uri, node_type="Skill"):
         """Get related graph for a node"""
@@ -182,14 +202,15 @@ class ESCOSemanticSearch:
         """Format multiple nodes for output"""
         return [self._format_node(node) for node in nodes if node]
 
-    def semantic_search_with_profile(self, query_text, limit=10, similarity_threshold=0.5):
+    def semantic_search_with_profile(self, query_text, limit=10, similarity_threshold=0.5, query_vec=None):
         """Perform semantic search and retrieve complete occupation profiles
-        
+
         Args:
             query_text (str): The text to search for
             limit (int): Maximum number of results to return
             similarity_threshold (float): Minimum similarity score (0.0 to 1.0)
-            
+            query_vec (list): Precomputed query embedding to reuse
+
         Returns:
             list: List of dictionaries containing search results with complete occupation profiles
         """
@@ -198,7 +219,8 @@ class ESCOSemanticSearch:
             query_text=query_text,
             node_type="Occupation",
             limit=limit,
-            similarity_threshold=similarity_threshold
+            similarity_threshold=similarity_threshold,
+            query_vec=query_vec
         )
         
         # Second hop: Retrieve complete profiles for each result